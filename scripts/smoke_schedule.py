@@ -0,0 +1,24 @@
+"""schedule_crawling 수동 스모크 테스트.
+
+저장소 루트에서 실행:
+    python scripts/smoke_schedule.py
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# 봇 런타임과 동일하게 src/를 import 경로에 추가 (Dockerfile의 PYTHONPATH 참고)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from crawlers.schedule_crawling import close_session, fetch_opgg_lol_schedule
+
+
+async def main():
+    try:
+        print(await fetch_opgg_lol_schedule("98", 2025, 9))
+    finally:
+        await close_session()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
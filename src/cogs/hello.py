@@ -1,29 +1,38 @@
+import logging
+import time
+
 import discord
 from discord.ext import commands
 
-async def safe_send(ctx_or_channel, content=None, **kwargs):
-    """Rate Limit 안전한 메시지 전송"""
+log = logging.getLogger(__name__)
+
+async def safe_reply(ctx: commands.Context, content=None, **kwargs):
+    """Rate Limit 안전한 답장 전송 (작성자 멘션 없이 원본 메시지에 연결)"""
     try:
-        if hasattr(ctx_or_channel, 'send'):
-            return await ctx_or_channel.send(content, **kwargs)
-        else:
-            return await ctx_or_channel.send(content, **kwargs)
+        return await ctx.reply(content, mention_author=False, **kwargs)
     except Exception as e:
-        print(f"메시지 전송 실패: {e}")
+        log.warning("메시지 전송 실패: %s", e)
         return None
 
 class HelloCommand(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # (측정 시각, ms) — 핑 도배 시 1초 안에는 같은 값을 재사용
+        self._last_ping: tuple[float, int] = (0.0, 0)
     
     @commands.command(name='안녕', help='봇이 인사해요!')
     async def hello(self, ctx: commands.Context):
-        await safe_send(ctx, f'안녕하세요 {ctx.author.mention}님! 🎮\n롤, 발로란트, 오버워치의 이스포츠 뉴스를 알려드릴게요!')
-    
+        await safe_reply(ctx, f'안녕하세요 {ctx.author.mention}님! 🎮\n롤, 발로란트, 오버워치의 이스포츠 뉴스를 알려드릴게요!')
+
     @commands.command(name='핑', help='봇의 응답속도를 알려줍니다.')
     async def ping(self, ctx: commands.Context):
-        latency = round(ctx.bot.latency * 1000)
-        await safe_send(ctx, f'🏓 퐁! 응답속도: **{latency}ms**')
+        now = time.monotonic()
+        if now - self._last_ping[0] < 1.0:
+            latency = self._last_ping[1]
+        else:
+            latency = round(ctx.bot.latency * 1000)
+            self._last_ping = (now, latency)
+        await safe_reply(ctx, f'🏓 퐁! 응답속도: **{latency}ms**')
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(HelloCommand(bot))
\ No newline at end of file
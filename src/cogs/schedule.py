@@ -5,8 +5,9 @@ import certifi
 from discord.ext import commands, tasks
 from crawlers.schedule_crawling import (
     fetch_valorant_league_schedule,
-    fetch_opgg_lol_schedule,
+    fetch_opgg_lol_schedules_bulk,
     parse_opgg_matches_list,
+    close_session as close_crawler_session,
 )
 from datetime import datetime, timezone
 import discord
@@ -148,6 +149,8 @@ class ScheduleCommand(commands.Cog):
         if self.session:
             await self.session.close()
             self.session = None
+        # 크롤러 쪽 공유 세션도 함께 정리
+        await close_crawler_session()
 
     async def send_upcoming_embeds(self, channel: discord.TextChannel, upcoming: List[dict]):
         # 이미지 배너 생성 및 Embed 전송
@@ -298,15 +301,15 @@ class ScheduleCommand(commands.Cog):
 
         upcoming: list[dict] = []
 
-        # 현재 달부터 최대 다음 달까지 조회하여 4경기 수집
-        for offset in (0, 1):
-            y, m = _year_month_with_offset(now_dt.year, now_dt.month, offset)
-            try:
-                resp = await fetch_opgg_lol_schedule(str(league_code), y, m)
-            except Exception as e:
-                print(f"OP.GG 일정 조회 실패 (league={league_code}, {y}-{m}): {e}")
-                continue
+        # 현재 달과 다음 달을 동시에 조회하여 4경기 수집 (직렬 N×RTT → 병렬 ~1×RTT)
+        months = [_year_month_with_offset(now_dt.year, now_dt.month, offset) for offset in (0, 1)]
+        try:
+            responses = await fetch_opgg_lol_schedules_bulk(str(league_code), months)
+        except Exception as e:
+            print(f"OP.GG 일정 조회 실패 (league={league_code}): {e}")
+            return
 
+        for resp in responses:
             matches = parse_opgg_matches_list(resp)
             for match in matches:
                 start_date_norm = _normalize_iso(match.get("startDate"))
@@ -315,8 +318,6 @@ class ScheduleCommand(commands.Cog):
                 match["startDate"] = start_date_norm
                 if start_date_norm >= now_iso:
                     upcoming.append(match)
-            if len(upcoming) >= 4:
-                break
 
         if not upcoming:
             return
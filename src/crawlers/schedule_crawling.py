@@ -1,17 +1,202 @@
 import asyncio
+import operator
+import random
+import time
 import aiohttp
+import msgspec
+import orjson
 from datetime import datetime, timezone, timedelta
+from typing import Any, Awaitable, Callable, Iterable
 from zoneinfo import ZoneInfo
 
-# 별칭 → 표준 키
+# 외부(cogs 등)에서 쓰는 공개 API — 나머지는 모듈 내부 구현입니다.
+__all__ = [
+    "VALORANT_LEAGUE_ALIAS",
+    "VALORANT_LEAGUE_IDS",
+    "get_session",
+    "close_session",
+    "fetch_opgg_lol_schedule",
+    "fetch_opgg_lol_schedules_bulk",
+    "parse_opgg_matches_list",
+    "fetch_valorant_league_schedule",
+]
+
+# 프로세스 전역 공유 세션 (keep-alive/커넥션 풀 재사용)
+_SESSION: aiohttp.ClientSession | None = None
+
+# OP.GG 동시 요청 상한 (여러 리그/월을 한꺼번에 조회해도 429가 나지 않도록)
+_OPGG_SEM = asyncio.Semaphore(8)
+
+# 일정 조회 TTL 캐시 (stale-while-revalidate)
+# FRESH 이내면 캐시 즉시 반환, STALE 이내면 캐시를 주되 백그라운드로 갱신,
+# 그 외에는 네트워크를 기다립니다. 키별 Lock으로 동시 miss를 한 요청으로 병합합니다.
+_CACHE: dict[tuple, tuple[float, Any]] = {}
+_CACHE_LOCKS: dict[tuple, asyncio.Lock] = {}
+_CACHE_FRESH = 60    # 초: 이 시간 안에는 무조건 캐시 사용
+_CACHE_STALE = 600   # 초: 이 시간 안에는 캐시를 주고 뒤에서 재검증
+
+
+async def _refresh_cache(key: tuple, fetch: Callable[[], Awaitable[Any]]):
+    """백그라운드 재검증: 이미 갱신 중이면 건너뜁니다."""
+    lock = _CACHE_LOCKS.setdefault(key, asyncio.Lock())
+    if lock.locked():
+        return
+    async with lock:
+        try:
+            result = await fetch()
+        except Exception as e:
+            print(f"⚠️ 일정 캐시 재검증 실패 {key}: {e}")
+            return
+        if result is not None:
+            _CACHE[key] = (time.monotonic(), result)
+
+
+async def _cached_fetch(key: tuple, fetch: Callable[[], Awaitable[Any]]):
+    """`key`에 대한 결과를 TTL 캐시를 거쳐 반환합니다.
+
+    실패(`None`) 응답은 캐시하지 않으므로 다음 호출이 다시 시도합니다.
+    """
+    entry = _CACHE.get(key)
+    if entry is not None:
+        age = time.monotonic() - entry[0]
+        if age < _CACHE_FRESH:
+            return entry[1]
+        if age < _CACHE_STALE:
+            asyncio.create_task(_refresh_cache(key, fetch))
+            return entry[1]
+
+    lock = _CACHE_LOCKS.setdefault(key, asyncio.Lock())
+    async with lock:
+        # Lock을 기다리는 동안 다른 코루틴이 채워 넣었을 수 있음 (single-flight)
+        entry = _CACHE.get(key)
+        if entry is not None and time.monotonic() - entry[0] < _CACHE_FRESH:
+            return entry[1]
+        result = await fetch()
+        if result is not None:
+            _CACHE[key] = (time.monotonic(), result)
+        return result
+
+async def get_session() -> aiohttp.ClientSession:
+    """크롤러 공용 `aiohttp.ClientSession`을 반환합니다.
+
+    매 호출마다 세션을 새로 만들면 요청 한 번에 TCP+TLS 핸드셰이크 비용을
+    전부 지불하므로, 최초 호출 시 한 번만 생성해 keep-alive 커넥션 풀을
+    재사용합니다. 종료 시에는 `close_session()`을 호출해 정리합니다.
+    """
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        _SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=8,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+            ),
+            json_serialize=lambda o: orjson.dumps(o).decode(),
+        )
+    return _SESSION
+
+
+async def close_session():
+    """공유 세션을 닫습니다. (봇 종료/Cog 언로드 시 호출)"""
+    global _SESSION
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+    _SESSION = None
+
+
+async def _opgg_post(session: aiohttp.ClientSession, url: str, *, headers: dict, json: dict, max_attempts: int = 4) -> aiohttp.ClientResponse:
+    """OP.GG에 POST를 보내되 429 응답은 지수 백오프로 재시도합니다.
+
+    세마포어로 동시 요청 수를 제한하고, 429를 받으면 `Retry-After` 헤더 값을
+    우선 사용해 대기합니다. 헤더가 없으면 `2**attempt + jitter`초 대기합니다.
+    마지막 시도의 응답을 그대로 반환하므로 상태 코드 확인은 호출부 몫입니다.
+    """
+    async with _OPGG_SEM:
+        for attempt in range(max_attempts):
+            response = await session.post(url, headers=headers, json=json)
+            if response.status != 429 or attempt == max_attempts - 1:
+                return response
+
+            retry_after = response.headers.get("Retry-After")
+            try:
+                delay = float(retry_after)
+            except (TypeError, ValueError):
+                delay = (2 ** attempt) + random.random()
+
+            response.release()
+            print(f"⏳ OP.GG Rate Limit(429) → {delay:.1f}초 후 재시도 ({attempt + 1}/{max_attempts - 1})")
+            await asyncio.sleep(delay)
+
+# GraphQL 응답을 중간 dict 없이 바로 타입 구조체로 디코딩하기 위한 msgspec 스키마.
+# 선언되지 않은 필드는 디코딩 시 무시됩니다.
+class _Team(msgspec.Struct):
+    acronym: str | None = None
+    name: str | None = None
+    imageUrl: str | None = None
+    imageUrlLightMode: str | None = None
+    imageUrlDarkMode: str | None = None
+
+
+class _Match(msgspec.Struct):
+    id: str | None = None
+    scheduledAt: str | None = None
+    status: str | None = None
+    homeScore: int | None = None
+    awayScore: int | None = None
+    homeTeam: _Team | None = None
+    awayTeam: _Team | None = None
+
+
+class _LolData(msgspec.Struct):
+    pagedAllMatches: list[_Match] | None = None
+
+
+class _LolEnvelope(msgspec.Struct):
+    data: _LolData | None = None
+
+
+class _ValData(msgspec.Struct):
+    matchesBySeries: list[_Match] | None = None
+
+
+class _ValEnvelope(msgspec.Struct):
+    data: _ValData | None = None
+
+
+# 디코더는 한 번 컴파일해 재사용
+_LOL_DECODER = msgspec.json.Decoder(_LolEnvelope)
+_VAL_DECODER = msgspec.json.Decoder(_ValEnvelope)
+
+# 팀 정보가 없는 경기에서 필드 보정용으로 공유하는 빈 팀 (매 경기 할당 방지)
+_EMPTY_TEAM = _Team()
+
+# 타임존/상태 매핑은 모듈 로드 시 한 번만 만들어 모든 파싱 루프가 공유
+KST = ZoneInfo("Asia/Seoul")
+
+_STATUS_MAP = {
+    "not_started": "BEFORE",
+    "running": "STARTED",
+    "finished": "END"
+}
+
+
+# 표준 키 → 별칭 목록 (대소문자는 조회 시 casefold로 정규화하므로 한 번씩만 기재)
+_ALIAS_RAW = {
+    "masters":  ("masters", "master", "마스터스"),
+    "emea":     ("emea",),
+    "pacific":  ("pacific", "퍼시픽"),
+    "americas": ("americas", "아메리카"),
+    "na":       ("na",),
+    "japan":    ("japan", "jp"),
+    "brazil":   ("brazil", "br"),
+}
+
+# 별칭(casefold) → 표준 키
 VALORANT_LEAGUE_ALIAS = {
-    "masters":  "masters", "MASTER": "masters", "마스터스": "masters",
-    "emea": "emea", "EMEA": "emea",
-    "pacific": "pacific", "PACIFIC": "pacific", "퍼시픽": "pacific",
-    "americas": "americas", "AMERICAS": "americas", "아메리카": "americas",
-    "na": "na", "NA": "na",
-    "japan": "japan", "JP": "japan",
-    "brazil": "brazil", "BR": "brazil",
+    alias.casefold(): key
+    for key, aliases in _ALIAS_RAW.items()
+    for alias in aliases
 }
 
 # 표준 키 → 실제 ID 목록
@@ -25,84 +210,43 @@ VALORANT_LEAGUE_IDS = {
     "brazil":   ["633"],
 }
 
-async def fetch_opgg_lol_schedule(league_id: str, year: int, month: int):
-    """OP.GG GraphQL: LoL 리그 일정 조회.
+_OPGG_LOL_URL = 'https://esports.op.gg/matches/graphql/__query__ListPagedAllMatches'
 
-    `ListPagedAllMatches` 쿼리를 통해 OP.GG에서 특정 리그/연월의 경기를
-    조회합니다. 타임존 보정은 서버 쿼리 변수의 `utcOffset`(분 단위)로 전달합니다.
-
-    Args:
-        league_id: OP.GG 리그 ID 문자열. 예) "98"(LPL), "99"(LCK).
-        year: 조회 연도. 예) 2025.
-        month: 조회 월(1-12).
-
-    Returns:
-        dict | None: 성공 시 원본 GraphQL JSON. 실패 시 `None`.
-    """
-    url = 'https://esports.op.gg/matches/graphql/__query__ListPagedAllMatches'
-
-    headers = {
-        'accept': '*/*',
-        'content-type': 'application/json',
-        'origin': 'https://esports.op.gg',
-        'referer': 'https://esports.op.gg/schedules/lpl',
-        'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
+_OPGG_LOL_HEADERS = {
+    'accept': '*/*',
+    # 압축 응답 요청: aiohttp가 수신 시 자동으로 풀어줍니다 (br은 brotli 패키지 필요)
+    'accept-encoding': 'br, gzip',
+    'content-type': 'application/json',
+    'origin': 'https://esports.op.gg',
+    'referer': 'https://esports.op.gg/schedules/lpl',
+    'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
 
-        # 전체 GraphQL 쿼리 문자열
-    query = """fragment CoreTeam on Team {
-    id
-    name
+# 전체 GraphQL 쿼리 문자열 (리그/연월만 변수로 바뀌는 정적 쿼리)
+# 선택 필드는 `parse_opgg_matches_list`가 실제로 읽는 것만 요청해 응답 크기를 줄입니다.
+_OPGG_LOL_QUERY = """fragment CoreTeam on Team {
     acronym
+    name
     imageUrl
-    nationality
-    foundedAt
-    imageUrlDarkMode
     imageUrlLightMode
-    youtube
-    twitter
-    facebook
-    instagram
-    discord
-    website
+    imageUrlDarkMode
     __typename
     }
 
     fragment CoreMatchCompact on Match {
     id
-    tournamentId
-    name
     scheduledAt
-    beginAt
-    matchType
-    homeTeamId
     homeTeam {
         ...CoreTeam
         __typename
     }
     homeScore
-    awayTeamId
     awayTeam {
         ...CoreTeam
         __typename
     }
     awayScore
-    winnerTeam {
-        ...CoreTeam
-        __typename
-    }
     status
-    draw
-    forfeit
-    matchVersion
-    __typename
-    }
-
-    fragment CoreTournament on Tournament {
-    id
-    name
-    beginAt
-    endAt
     __typename
     }
 
@@ -118,129 +262,188 @@ async def fetch_opgg_lol_schedule(league_id: str, year: int, month: int):
         utcOffset: $utcOffset
     ) {
         ...CoreMatchCompact
-        tournament {
-        ...CoreTournament
-        serie {
-            league {
-            shortName
-            region
-            __typename
-            }
-            year
-            season
-            __typename
-        }
-        __typename
-        }
         __typename
     }
     }"""
 
+
+async def fetch_opgg_lol_schedule(league_id: str, year: int, month: int):
+    """OP.GG GraphQL: LoL 리그 일정 조회.
+
+    `ListPagedAllMatches` 쿼리를 통해 OP.GG에서 특정 리그/연월의 경기를
+    조회합니다. 타임존 보정은 서버 쿼리 변수의 `utcOffset`(분 단위)로 전달합니다.
+    결과는 (리그, 연, 월) 단위 TTL 캐시를 거치므로 짧은 시간 안의 반복 호출은
+    네트워크를 타지 않습니다.
+
+    Args:
+        league_id: OP.GG 리그 ID 문자열. 예) "98"(LPL), "99"(LCK).
+        year: 조회 연도. 예) 2025.
+        month: 조회 월(1-12).
+
+    Returns:
+        _LolEnvelope | None: 성공 시 타입 구조체로 디코딩된 GraphQL 응답. 실패 시 `None`.
+    """
+    key = ("opgg_lol", league_id, year, month)
+    return await _cached_fetch(key, lambda: _fetch_opgg_lol_schedule(league_id, year, month))
+
+
+async def fetch_opgg_lol_schedules_bulk(league_id: str, months: Iterable[tuple[int, int]]) -> list:
+    """여러 (연, 월)의 LoL 일정을 동시에 조회합니다.
+
+    공유 세션/세마포어/TTL 캐시 위에서 동작하므로 동시 요청 수는 자동으로
+    제한됩니다. 결과는 입력 `months` 순서대로 반환되며, 실패한 달은 `None`입니다.
+
+    Args:
+        league_id: OP.GG 리그 ID 문자열.
+        months: (연도, 월) 튜플들의 목록. 예) [(2025, 8), (2025, 9)].
+    """
+    months = list(months)
+    tasks = [fetch_opgg_lol_schedule(league_id, year, month) for year, month in months]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # 한 달 조회가 예외로 끝나도 나머지 달은 살립니다.
+    schedules = []
+    for (year, month), result in zip(months, results):
+        if isinstance(result, BaseException):
+            print(f"⚠️ OP.GG 일정 조회 실패 (league={league_id}, {year}-{month}): {result}")
+            schedules.append(None)
+        else:
+            schedules.append(result)
+    return schedules
+
+
+async def _fetch_opgg_lol_schedule(league_id: str, year: int, month: int):
+    """`fetch_opgg_lol_schedule`의 실제 네트워크 경로 (캐시 미적용)."""
+    variables = {
+        "leagueId": league_id,
+        "year": year,
+        "month": month,
+        "teamId": None,
+        "utcOffset": 540,
+        "page": 0
+    }
     data = {
         "operationName": "ListPagedAllMatches",
-        "variables": {
-            "leagueId": league_id,
-            "year": year,
-            "month": month,
-            "teamId": None,
-            "utcOffset": 540,
-            "page": 0
-        },
-        "query": query
+        "variables": variables,
+        "query": _OPGG_LOL_QUERY
     }
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=headers, json=data) as response:
-            if response.status == 200:
-                data = await response.json()
-                return data
-            else:
-                response_text = await response.text()
-                print(f"❌ 롤 일정 크롤링 실패: {response.status}")
-                print(f"응답 내용: {response_text}")
+    session = await get_session()
+    response = await _opgg_post(session, _OPGG_LOL_URL, headers=_OPGG_LOL_HEADERS, json=data)
+    async with response:
+        if response.status == 200:
+            raw = await response.read()
+            try:
+                return _LOL_DECODER.decode(raw)
+            except msgspec.DecodeError as e:
+                print(f"❌ 롤 일정 응답 디코딩 실패: {e}")
                 return None
+        else:
+            response_text = await response.text()
+            print(f"❌ 롤 일정 크롤링 실패: {response.status}")
+            print(f"응답 내용: {response_text}")
+            return None
 
 
-def parse_opgg_matches_list(opgg_response: dict) -> list[dict]:
-    """OP.GG GraphQL 응답에서 경기 리스트를 납작한 구조로 파싱.
+def parse_opgg_matches_list(opgg_response: "_LolEnvelope | None") -> list[dict]:
+    """OP.GG GraphQL 응답 구조체에서 경기 리스트를 납작한 구조로 파싱.
 
     홈/원정 팀 정보가 누락된 경우에도 예외 없이 빈 문자열/빈 값으로 보정합니다.
 
     Args:
-        opgg_response: `ListPagedAllMatches` GraphQL 응답 딕셔너리.
+        opgg_response: `fetch_opgg_lol_schedule`가 반환한 `_LolEnvelope` 구조체.
 
     Returns:
         list[dict]: 각 경기마다 다음 키를 포함
             - matchId, startDate(KST ISO), status(BEFORE/STARTED/END),
               team1/2, team1Img/2Img, score1/2
     """
-    if not opgg_response or not opgg_response.get("data"):
+    if opgg_response is None or opgg_response.data is None:
         return []
 
-    matches = opgg_response.get("data", {}).get("pagedAllMatches") or []
-    if not isinstance(matches, list):
-        return []
+    matches = opgg_response.data.pagedAllMatches or []
 
-    # 상태 매핑
-    status_map = {
-        "not_started": "BEFORE",
-        "running": "STARTED", 
-        "finished": "END"
-    }
-    
+    # 핫 루프: 자주 쓰는 메서드/상수를 지역 변수로 바인딩해 반복 조회를 줄입니다.
     parsed_matches = []
-    KST = ZoneInfo("Asia/Seoul")
+    append = parsed_matches.append
+    status_get = _STATUS_MAP.get
+    fromiso = datetime.fromisoformat
+    kst = KST
 
     for match in matches:
-        if not isinstance(match, dict):
-            continue
-
-        home_team = match.get("homeTeam") or {}
-        away_team = match.get("awayTeam") or {}
+        home_team = match.homeTeam or _EMPTY_TEAM
+        away_team = match.awayTeam or _EMPTY_TEAM
 
-        team1 = home_team.get("acronym") or home_team.get("name") or ""
-        team2 = away_team.get("acronym") or away_team.get("name") or ""
+        team1 = home_team.acronym or home_team.name or ""
+        team2 = away_team.acronym or away_team.name or ""
 
         team1_img = (
-            home_team.get("imageUrl")
-            or home_team.get("imageUrlLightMode")
-            or home_team.get("imageUrlDarkMode")
+            home_team.imageUrl
+            or home_team.imageUrlLightMode
+            or home_team.imageUrlDarkMode
             or ""
         )
         team2_img = (
-            away_team.get("imageUrl")
-            or away_team.get("imageUrlLightMode")
-            or away_team.get("imageUrlDarkMode")
+            away_team.imageUrl
+            or away_team.imageUrlLightMode
+            or away_team.imageUrlDarkMode
             or ""
         )
 
         # UTC 시간포맷을 KST로 변환해 저장
-        sched_str = match.get("scheduledAt")
+        sched_str = match.scheduledAt
         start_kst_iso = None
-        if isinstance(sched_str, str) and sched_str:
+        if sched_str:
             try:
-                utc_dt = datetime.fromisoformat(sched_str.replace("Z", "+00:00"))
-                start_kst_iso = utc_dt.astimezone(KST).isoformat()
+                utc_dt = fromiso(sched_str[:-1] + "+00:00") if sched_str.endswith("Z") else fromiso(sched_str)
+                start_kst_iso = utc_dt.astimezone(kst).isoformat()
             except Exception:
                 start_kst_iso = sched_str
 
-        parsed_matches.append(
+        raw_status = match.status
+        append(
             {
-                "matchId": match.get("id"),
+                "matchId": match.id,
                 "startDate": start_kst_iso,
-                "status": status_map.get(match.get("status"), match.get("status")),
+                "status": status_get(raw_status, raw_status),
                 "team1": team1,
                 "team2": team2,
                 "team1Img": team1_img,
                 "team2Img": team2_img,
-                "score1": match.get("homeScore"),
-                "score2": match.get("awayScore"),
+                "score1": match.homeScore,
+                "score2": match.awayScore,
             }
         )
 
     return parsed_matches
 
 
+_VAL_URL = "https://esports.op.gg/valorant/graphql/__query__GetMatchesBySeries"
+
+_VAL_HEADERS = {
+    'accept': '*/*',
+    'accept-encoding': 'br, gzip',
+    'content-type': 'application/json',
+    'origin': 'https://esports.op.gg',
+    'referer': 'https://esports.op.gg/valorant',
+}
+
+_VAL_QUERY = """
+    fragment CoreTeam on Team { name imageUrl __typename }
+    fragment CoreValorantMatchCompact on Match {
+        id scheduledAt
+        homeTeam { ...CoreTeam __typename } homeScore
+        awayTeam { ...CoreTeam __typename } awayScore
+        status __typename
+    }
+    query GetMatchesBySeries($serieIds: [ID]!, $from: Date, $to: Date, $teamId: ID) {
+        matchesBySeries(serieIds: $serieIds, from: $from, to: $to, teamId: $teamId) {
+            ...CoreValorantMatchCompact serieId __typename
+        }
+    }
+"""
+
+
 async def fetch_valorant_league_schedule(league_input: str):
     """OP.GG Valorant: 별칭 기반 시리즈들에 대한 30일 범위 경기 조회.
 
@@ -254,7 +457,7 @@ async def fetch_valorant_league_schedule(league_input: str):
         list[dict] | None: 경기 리스트(각 경기의 시작 시간이 KST ISO 형식). 없으면 `None`.
     """
     # 1. 입력받은 별칭(league_input)으로 표준 키 찾기
-    standard_key = VALORANT_LEAGUE_ALIAS.get(league_input.lower())
+    standard_key = VALORANT_LEAGUE_ALIAS.get(league_input.casefold())
     if not standard_key:
         # 오류 메시지에서 원래 입력값(league_input)을 사용하도록 수정
         print(f"'{league_input}'에 해당하는 리그를 찾을 수 없습니다.")
@@ -270,82 +473,83 @@ async def fetch_valorant_league_schedule(league_input: str):
     utc_now = datetime.now(timezone.utc)
     from_date_str = utc_now.strftime("%Y-%m-%d")
     to_date_str = (utc_now + timedelta(days=30)).strftime("%Y-%m-%d")
-    
-    url = "https://esports.op.gg/valorant/graphql/__query__GetMatchesBySeries"
-    headers = {
-        'accept': '*/*',
-        'content-type': 'application/json',
-        'origin': 'https://esports.op.gg',
-        'referer': 'https://esports.op.gg/valorant',
-    }
 
-    query = """
-        fragment CoreTeam on Team { id name acronym imageUrl nationality __typename }
-        fragment CoreValorantMatchCompact on Match {
-            id tournamentId name scheduledAt beginAt matchType
-            homeTeamId homeTeam { ...CoreTeam __typename } homeScore
-            awayTeamId awayTeam { ...CoreTeam __typename } awayScore
-            winnerTeam { ...CoreTeam __typename }
-            status draw forfeit matchVersion __typename
-        }
-        query GetMatchesBySeries($serieIds: [ID]!, $from: Date, $to: Date, $teamId: ID) {
-            matchesBySeries(serieIds: $serieIds, from: $from, to: $to, teamId: $teamId) {
-                ...CoreValorantMatchCompact serieId __typename
-            }
-        }
-    """
+    # 4. 시리즈 단위로 나눠 병렬 조회 (시리즈별 TTL 캐시 + 부분 실패 허용)
+    tasks = [
+        _cached_fetch(
+            ("valorant_serie", serie_id, from_date_str, to_date_str),
+            lambda sid=serie_id: _fetch_valorant_serie_matches([sid], from_date_str, to_date_str),
+        )
+        for serie_id in serieIds_list
+    ]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    matches_list = []
+    for serie_id, result in zip(serieIds_list, results):
+        if isinstance(result, Exception):
+            print(f"⚠️ 발로란트 시리즈 {serie_id} 조회 실패: {result}")
+        elif result:
+            matches_list.extend(result)
+
+    if not matches_list:
+        return None
+
+    matches_list.sort(key=operator.itemgetter('startDate'))
+    return matches_list
+
+
+async def _fetch_valorant_serie_matches(serieIds_list: list[str], from_date_str: str, to_date_str: str):
+    """단일 시리즈 묶음에 대한 실제 네트워크 경로 (캐시 미적용, 정렬 안 함)."""
     payload = {
         "operationName": "GetMatchesBySeries",
         "variables": { "serieIds": serieIds_list, "from": from_date_str, "to": to_date_str },
-        "query": query
+        "query": _VAL_QUERY
     }
 
-    # 4. 요청 보내기
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=headers, json=payload) as response:
-            if response.status == 200:
-                data = await response.json()
-
-                matches = data.get('data', {}).get('matchesBySeries')
-                if not matches:
-                    return None
-                
-                sorted_matches = sorted(matches, key=lambda x: x.get('scheduledAt'))
+    session = await get_session()
+    response = await _opgg_post(session, _VAL_URL, headers=_VAL_HEADERS, json=payload)
+    async with response:
+        if response.status == 200:
+            try:
+                envelope = _VAL_DECODER.decode(await response.read())
+            except msgspec.DecodeError as e:
+                print(f"❌ 발로란트 일정 응답 디코딩 실패: {e}")
+                return None
 
-                KST = ZoneInfo("Asia/Seoul")
+            matches = envelope.data.matchesBySeries if envelope.data else None
+            if not matches:
+                return None
 
-                status_map = {
-                    "not_started": "BEFORE",
-                    "running": "STARTED",
-                    "finished": "END"
+            # 정렬은 시리즈들을 합친 뒤 호출부에서 한 번만 수행합니다.
+            matches_list = []
+            fromiso = datetime.fromisoformat
+            for match in matches:
+                s = match.scheduledAt
+                utc_time = fromiso(s[:-1] + "+00:00") if s.endswith("Z") else fromiso(s)
+                kst_time = utc_time.astimezone(KST)
+
+                # 중첩 팀 구조체는 경기당 한 번만 꺼내 재사용 (키 체인 반복 조회 제거)
+                home_team = match.homeTeam or _EMPTY_TEAM
+                away_team = match.awayTeam or _EMPTY_TEAM
+
+                raw_status = match.status
+                valorant_match = {
+                    "matchId": match.id,
+                    "startDate": kst_time.isoformat(),
+                    "status": _STATUS_MAP.get(raw_status, raw_status),
+                    "leagueName": None,
+                    "blockName": None,
+                    "team1": home_team.name,
+                    "team2": away_team.name,
+                    "team1Img": home_team.imageUrl,
+                    "team2Img": away_team.imageUrl,
+                    "score1": match.homeScore,
+                    "score2": match.awayScore,
                 }
+                matches_list.append(valorant_match)
 
-                matches_list = []
-                for match in sorted_matches:
-                    utc_time = datetime.fromisoformat(match.get('scheduledAt').replace('Z', '+00:00'))
-                    kst_time = utc_time.astimezone(KST)
-
-                    valorant_match = {
-                        "matchId": match.get("id"),
-                        "startDate": kst_time.isoformat(),
-                        "status": status_map.get(match.get("status"), match.get("status")),
-                        "leagueName": None,
-                        "blockName": None,
-                        "team1": match.get("homeTeam", {}).get("name"),
-                        "team2": match.get("awayTeam", {}).get("name"),
-                        "team1Img": match.get("homeTeam", {}).get("imageUrl"),
-                        "team2Img": match.get("awayTeam", {}).get("imageUrl"),
-                        "score1": match.get("homeScore"),
-                        "score2": match.get("awayScore"),
-                    }
-                    matches_list.append(valorant_match)
-
-                return matches_list
-
-            else:
-                print(f"❌ 발로란트 일정 크롤링 실패: {response.status}")
-                return None
-            
+            return matches_list
 
-if __name__ == "__main__":
-    print(asyncio.run(fetch_opgg_lol_schedule("98", 2025, 9)))
\ No newline at end of file
+        else:
+            print(f"❌ 발로란트 일정 크롤링 실패: {response.status}")
+            return None
\ No newline at end of file